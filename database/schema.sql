@@ -33,6 +33,9 @@ CREATE TABLE IF NOT EXISTS meets (
     location TEXT,
     season TEXT,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    -- Year extracted once at write time so year-filtered queries can
+    -- seek an index instead of running strftime over every row
+    meet_year INTEGER GENERATED ALWAYS AS (CAST(strftime('%Y', meet_date) AS INTEGER)) STORED,
     UNIQUE(name, meet_date)
 );
 
@@ -65,14 +68,30 @@ CREATE TABLE IF NOT EXISTS relay_members (
     UNIQUE(result_id, athlete_id)
 );
 
+-- Best mark per athlete/event, rebuilt after ingest (see
+-- Database.refresh_athlete_event_best) so read paths can join this
+-- table instead of recomputing MIN/MAX over all results
+CREATE TABLE IF NOT EXISTS athlete_event_best (
+    athlete_id INTEGER NOT NULL REFERENCES athletes(id),
+    event_id INTEGER NOT NULL REFERENCES events(id),
+    best_mark REAL NOT NULL,
+    best_result_id INTEGER NOT NULL REFERENCES results(id),
+    PRIMARY KEY (athlete_id, event_id)
+);
+
 -- Indexes for common queries
 CREATE INDEX IF NOT EXISTS idx_results_athlete ON results(athlete_id);
 CREATE INDEX IF NOT EXISTS idx_results_event ON results(event_id);
 CREATE INDEX IF NOT EXISTS idx_results_meet ON results(meet_id);
+CREATE INDEX IF NOT EXISTS idx_results_athlete_event ON results(athlete_id, event_id, meet_id);
+CREATE INDEX IF NOT EXISTS idx_results_event_mark ON results(event_id, mark);
 CREATE INDEX IF NOT EXISTS idx_athletes_name ON athletes(last_name, first_name);
 CREATE INDEX IF NOT EXISTS idx_athletes_gender ON athletes(gender);
 CREATE INDEX IF NOT EXISTS idx_meets_season ON meets(season);
 CREATE INDEX IF NOT EXISTS idx_meets_date ON meets(meet_date);
+CREATE INDEX IF NOT EXISTS idx_meets_year ON meets(meet_year);
+CREATE INDEX IF NOT EXISTS idx_relay_members_result ON relay_members(result_id, leg_order);
+CREATE INDEX IF NOT EXISTS idx_aeb_event ON athlete_event_best(event_id, best_mark);
 
 -- Views for common queries
 
@@ -163,9 +182,28 @@ CREATE TABLE IF NOT EXISTS page_views (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     page_type TEXT NOT NULL,  -- 'athlete', 'event', 'team_bests', 'events_list', 'home'
     page_detail TEXT,          -- event name or team name (NULL for athlete pages for privacy)
-    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+    -- Hour of day, precomputed so the hourly analytics query doesn't
+    -- parse every timestamp at read time
+    view_hour INTEGER GENERATED ALWAYS AS (CAST(strftime('%H', timestamp) AS INTEGER)) STORED
 );
 
--- Index for analytics queries
+-- Indexes for analytics queries. The composite index covers the raw
+-- time-window scans (trend endpoint, rollup backfill) so they never
+-- touch the base table
 CREATE INDEX IF NOT EXISTS idx_page_views_timestamp ON page_views(timestamp);
 CREATE INDEX IF NOT EXISTS idx_page_views_page_type ON page_views(page_type);
+CREATE INDEX IF NOT EXISTS idx_page_views_ts_type ON page_views(timestamp, page_type, page_detail);
+
+-- Daily rollup of page views, maintained incrementally by the webapp's
+-- page-view writer so analytics reads scan O(days) rows instead of the
+-- raw page_views table. page_detail uses '' (not NULL) so the upsert
+-- conflict target works
+CREATE TABLE IF NOT EXISTS page_view_daily (
+    date TEXT NOT NULL,
+    hour INTEGER NOT NULL,
+    page_type TEXT NOT NULL,
+    page_detail TEXT NOT NULL DEFAULT '',
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (date, hour, page_type, page_detail)
+);
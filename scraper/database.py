@@ -199,6 +199,45 @@ class Database:
             except sqlite3.IntegrityError:
                 return None
 
+    def refresh_athlete_event_best(self):
+        """Rebuild the materialized best-mark-per-athlete/event table.
+
+        Called after ingesting results so the webapp can serve PRs, team
+        bests, and event records from simple joins instead of
+        recomputing MIN/MAX over the results table on every request.
+        """
+        with self.get_connection() as conn:
+            # Older databases were created before this table existed
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS athlete_event_best (
+                    athlete_id INTEGER NOT NULL REFERENCES athletes(id),
+                    event_id INTEGER NOT NULL REFERENCES events(id),
+                    best_mark REAL NOT NULL,
+                    best_result_id INTEGER NOT NULL REFERENCES results(id),
+                    PRIMARY KEY (athlete_id, event_id)
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_aeb_event
+                ON athlete_event_best(event_id, best_mark)
+            """)
+            conn.execute("DELETE FROM athlete_event_best")
+            conn.execute("""
+                INSERT INTO athlete_event_best (athlete_id, event_id, best_mark, best_result_id)
+                SELECT athlete_id, event_id, mark, id
+                FROM (
+                    SELECT r.athlete_id, r.event_id, r.mark, r.id,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY r.athlete_id, r.event_id
+                               ORDER BY CASE WHEN e.lower_is_better THEN r.mark END ASC,
+                                        CASE WHEN NOT e.lower_is_better THEN r.mark END DESC
+                           ) as rn
+                    FROM results r
+                    JOIN events e ON r.event_id = e.id
+                )
+                WHERE rn = 1
+            """)
+
     def initialize_events_from_config(self, config_path: str = None):
         """Load canonical events from config into database."""
         if config_path is None:
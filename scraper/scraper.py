@@ -502,7 +502,10 @@ def main():
         scraper.scrape_directory(args.meet_dir)
     else:
         scraper.scrape_all()
-    
+
+    # Rebuild the materialized best-marks table now that results changed
+    scraper.db.refresh_athlete_event_best()
+
     logger.info("Scraping complete!")
 
 
@@ -66,7 +66,10 @@ def import_historical_records(db_path: str = None):
     total = boys_count + girls_count
     logger.info(f"Imported {boys_count} boys records, {girls_count} girls records")
     logger.info(f"Total historical records imported: {total}")
-    
+
+    # Keep the materialized best-marks table in sync with the new results
+    db.refresh_athlete_event_best()
+
     return total
 
 
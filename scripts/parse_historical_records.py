@@ -7,22 +7,36 @@ import json
 import re
 from pathlib import Path
 
+# Translation table mapping every curly/typographic quote variant to the
+# straight equivalent, built once instead of chaining str.replace per mark
+_QUOTE_TRANS = str.maketrans({
+    '‛': "'", '′': "'",
+    '″': '"',
+    chr(8217): "'",  # RIGHT SINGLE QUOTATION MARK
+    chr(8216): "'",  # LEFT SINGLE QUOTATION MARK
+    chr(8221): '"',  # RIGHT DOUBLE QUOTATION MARK
+    chr(8220): '"',  # LEFT DOUBLE QUOTATION MARK
+})
+
+# Patterns compiled once; these helpers run for every record line
+_IMPERIAL_RE = re.compile(r"(\d+)'\s*(\d+\.?\d*)\"?")
+_YEAR_RE = re.compile(r'(\d{4})')
+
+# Lowercased keywords that mark an event as timed (everything else is a
+# distance/height event)
+_TIMED_EVENT_KEYWORDS = ('100m', '200m', '400m', '800m', '1600m', '3200m',
+                         '110m high hurdles', '100m high hurdles',
+                         '300m int. hurdles', '300m low hurdles',
+                         'relay', 'medley')
+
 
 def parse_imperial_to_meters(mark_str):
     """Convert feet/inches marks to meters."""
     # Clean up the string - handle both regular and curly quotes
-    mark_str = mark_str.strip()
-    # Replace all variants of curly quotes with straight quotes
-    mark_str = mark_str.replace("'", "'").replace("'", "'").replace("‛", "'").replace("′", "'")
-    mark_str = mark_str.replace(""", '"').replace(""", '"').replace("″", '"')
-    # Also handle Unicode characters by code point
-    mark_str = mark_str.replace(chr(8217), "'")  # RIGHT SINGLE QUOTATION MARK
-    mark_str = mark_str.replace(chr(8216), "'")  # LEFT SINGLE QUOTATION MARK
-    mark_str = mark_str.replace(chr(8221), '"')  # RIGHT DOUBLE QUOTATION MARK
-    mark_str = mark_str.replace(chr(8220), '"')  # LEFT DOUBLE QUOTATION MARK
-    
+    mark_str = mark_str.strip().translate(_QUOTE_TRANS)
+
     # Pattern: 14'6" or 24'0.25" or 6'8.5" or 38' 6" (with space)
-    match = re.match(r"(\d+)'\s*(\d+\.?\d*)\"?", mark_str)
+    match = _IMPERIAL_RE.match(mark_str)
     if match:
         feet = int(match.group(1))
         inches = float(match.group(2))
@@ -69,7 +83,7 @@ def parse_time_to_seconds(mark_str):
 
 def infer_year_from_location(location_str):
     """Extract year from location string like 'State 2012'."""
-    match = re.search(r'(\d{4})', location_str)
+    match = _YEAR_RE.search(location_str)
     if match:
         return int(match.group(1))
     return None
@@ -77,13 +91,9 @@ def infer_year_from_location(location_str):
 
 def parse_event_type(event_name):
     """Determine if event is timed (True) or distance/height (False)."""
-    timed_events = ['100m', '200m', '400m', '800m', '1600m', '3200m', 
-                    '110m High Hurdles', '100M High Hurdles', 
-                    '300m Int. Hurdles', '300M Low Hurdles',
-                    'Relay', 'relay', 'Medley', 'medley']
-    
-    for timed in timed_events:
-        if timed.lower() in event_name.lower():
+    event_lower = event_name.lower()
+    for timed in _TIMED_EVENT_KEYWORDS:
+        if timed in event_lower:
             return True
     return False
 
@@ -97,12 +107,16 @@ def parse_boys_records():
         content = f.read()
     
     lines = content.split('\n')
-    
-    for line in lines:
-        line = line.strip()
-        if not line or line.startswith('**') or 'EVENT' in line or 'ATHLETE' in line:
+    # Strip every line once up front; the relay pass below re-reads the
+    # same lines and would otherwise strip them a second time
+    stripped = [l.strip() for l in lines]
+
+    for line in stripped:
+        # Header lines start with '**' or the EVENT/ATHLETE column labels,
+        # so one tuple startswith covers all of them in a single check
+        if not line or line.startswith(('**', 'EVENT', 'ATHLETE')):
             continue
-        
+
         # Parse individual events
         # Pattern: EVENT    ATHLETE    MARK    LOCATION
         parts = re.split(r'\t+', line)
@@ -149,14 +163,12 @@ def parse_boys_records():
         records.append(record)
     
     # Now find relay team members in subsequent lines
-    for i, line in enumerate(lines):
-        line_stripped = line.strip()
-        
+    for i, line_stripped in enumerate(stripped):
         # Check if this line contains relay designation like (4x100)
         # and possibly the first relay member
         if re.match(r'^\([0-9x-]+\)', line_stripped):
             # Parse out any athlete name on this line
-            parts = re.split(r'\t+', line)
+            parts = re.split(r'\t+', lines[i])
             additional_member = None
             if len(parts) >= 2:
                 additional_member = parts[1].strip()
@@ -175,10 +187,7 @@ def parse_boys_records():
                         members.append(additional_member)
                     
                     # Get the remaining team members from following lines
-                    for j in range(i+1, min(i+5, len(lines))):
-                        raw_line = lines[j]
-                        member_line = raw_line.strip()
-                        
+                    for raw_line, member_line in zip(lines[i+1:i+5], stripped[i+1:i+5]):
                         # Skip empty lines and header lines
                         if not member_line or member_line.startswith('**'):
                             continue
@@ -209,12 +218,14 @@ def parse_girls_records():
         content = f.read()
     
     lines = content.split('\n')
-    
-    for line in lines:
-        line = line.strip()
-        if not line or line.startswith('**') or 'EVENT' in line or 'ATHLETE' in line:
+    # Strip every line once up front; the relay pass below re-reads the
+    # same lines and would otherwise strip them a second time
+    stripped = [l.strip() for l in lines]
+
+    for line in stripped:
+        if not line or line.startswith(('**', 'EVENT', 'ATHLETE')):
             continue
-        
+
         # Parse individual events - handle variable whitespace
         # Split on multiple spaces (at least 2)
         parts = re.split(r'\s{2,}', line)
@@ -261,14 +272,12 @@ def parse_girls_records():
         records.append(record)
     
     # Find relay team members
-    for i, line in enumerate(lines):
-        line_stripped = line.strip()
-        
+    for i, line_stripped in enumerate(stripped):
         # Check if this line contains relay info like (4x100)
         # and possibly the first relay member after the primary athlete
         if re.match(r'^\([0-9x-]+\)', line_stripped):
             # Parse out any athlete name on this line (girls format uses spaces not tabs)
-            parts = re.split(r'\s{2,}', line)
+            parts = re.split(r'\s{2,}', lines[i])
             additional_member = None
             if len(parts) >= 2:
                 # First part is (4x100), second might be athlete name
@@ -288,13 +297,12 @@ def parse_girls_records():
                         members.append(additional_member)
                     
                     # Get the remaining team members from following lines
-                    for j in range(i+1, min(i+5, len(lines))):
-                        member_line = lines[j].strip()
+                    for raw_line, member_line in zip(lines[i+1:i+5], stripped[i+1:i+5]):
                         # Skip empty lines and header lines
                         if not member_line or member_line.startswith('**'):
                             continue
                         # Stop if we hit another event (has multiple spaces indicating columns)
-                        if re.search(r'\s{2,}', lines[j]) and not lines[j].startswith(' '):
+                        if re.search(r'\s{2,}', raw_line) and not raw_line.startswith(' '):
                             break
                         # Add the member
                         if member_line and len(member_line) > 1 and not member_line.startswith('('):
@@ -2,21 +2,50 @@
 Fort Collins Track Stats Web Application
 """
 
+import atexit
+import queue
 import sqlite3
 import logging
-import re
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from contextlib import contextmanager
-from functools import wraps
+from functools import lru_cache, wraps
+from itertools import groupby
+from operator import itemgetter
 from flask import Flask, render_template, request, jsonify, g
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 
+if orjson is not None:
+    from flask.json.provider import JSONProvider
+
+    class OrjsonProvider(JSONProvider):
+        """JSON provider backed by orjson's C serializer.
+
+        jsonify on the analytics endpoints can emit thousands of rows;
+        orjson serializes straight to bytes instead of building an
+        intermediate unicode string with the stdlib encoder.
+        """
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj)
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+
 # Configuration
 import os
 DATABASE_PATH = os.environ.get('DATABASE_PATH', str(Path(__file__).parent.parent / 'data' / 'fct_stats.db'))
@@ -24,83 +53,407 @@ DATABASE_PATH = os.environ.get('DATABASE_PATH', str(Path(__file__).parent.parent
 # Secret key for hidden analytics page (change this in production!)
 ANALYTICS_SECRET = os.environ.get('ANALYTICS_SECRET', 'lambkin-purple-stats-2025')
 
-# Common bot user agent patterns
-BOT_PATTERNS = [
-    r'bot', r'crawler', r'spider', r'scraper', r'headless',
-    r'googlebot', r'bingbot', r'slurp', r'duckduckbot', r'baiduspider',
-    r'yandexbot', r'sogou', r'exabot', r'facebot', r'ia_archiver',
-    r'semrush', r'ahref', r'mj12bot', r'dotbot', r'petalbot',
-    r'curl', r'wget', r'python-requests', r'python-urllib', r'httpx',
-    r'axios', r'node-fetch', r'go-http-client', r'java/', r'libwww',
-    r'apache-httpclient', r'okhttp', r'feedfetcher', r'mediapartners',
-    r'adsbot', r'apis-google', r'lighthouse', r'chrome-lighthouse',
-    r'pingdom', r'uptimerobot', r'statuscake', r'site24x7',
-    r'phantomjs', r'selenium', r'puppeteer', r'playwright',
-    r'facebookexternalhit', r'twitterbot', r'linkedinbot', r'slackbot',
-    r'telegrambot', r'whatsapp', r'discordbot',
-]
-BOT_REGEX = re.compile('|'.join(BOT_PATTERNS), re.IGNORECASE)
+# Outside local development, don't stat template files on every render;
+# compiled templates stay cached for the life of the worker
+if os.environ.get('FLASK_ENV', 'production') == 'production':
+    app.config['TEMPLATES_AUTO_RELOAD'] = False
+    app.jinja_env.auto_reload = False
+
+# Common bot user agent substrings, as plain lowercase literals. The
+# hot tuple covers the tokens that appear in nearly all bot traffic
+# ('bot' alone matches googlebot, bingbot, adsbot, ...), so the cold
+# tuple only lists bots not containing a hot token and most requests
+# settle after the short first scan
+BOT_PATTERNS_HOT = (
+    'bot', 'crawler', 'spider', 'scraper', 'http', 'curl', 'wget', 'python-',
+)
+BOT_PATTERNS_COLD = (
+    'headless', 'slurp', 'sogou', 'ia_archiver',
+    'semrush', 'ahref', 'axios', 'node-fetch', 'java/', 'libwww',
+    'feedfetcher', 'mediapartners', 'apis-google', 'lighthouse',
+    'pingdom', 'statuscake', 'site24x7',
+    'phantomjs', 'selenium', 'puppeteer', 'playwright',
+    'facebookexternalhit', 'whatsapp',
+)
+
+
+# The same UA strings repeat for a whole browsing session (and bots
+# hammer with one UA), so classification results are memoized
+@lru_cache(maxsize=4096)
+def _is_bot_cached(ua):
+    return (any(pattern in ua for pattern in BOT_PATTERNS_HOT)
+            or any(pattern in ua for pattern in BOT_PATTERNS_COLD))
 
 
 def is_bot(user_agent):
     """Check if the user agent appears to be a bot."""
     if not user_agent:
         return True  # No user agent is suspicious
-    return bool(BOT_REGEX.search(user_agent))
+    return _is_bot_cached(user_agent.lower())
+
+
+# Page views are buffered here and flushed by a background thread so the
+# INSERT + fsync never sits on the request path
+# Bounded so a stalled writer sheds analytics rather than growing the
+# queue without limit
+_page_view_queue = queue.Queue(maxsize=10000)
+_PAGE_VIEW_BATCH_SIZE = 100
+_PAGE_VIEW_FLUSH_INTERVAL = 1.0  # seconds
+
+
+# Dedicated connection for the writer thread, opened on first flush.
+# isolation_level=None hands transaction control to the explicit
+# BEGIN IMMEDIATE below: one write lock and one WAL sync per batch
+_writer_conn = None
+
+
+def _flush_page_views(batch):
+    """Write a batch of queued page views in a single transaction,
+    keeping the page_view_daily rollup in step."""
+    global _writer_conn
+    if not batch:
+        return
+    # Pre-aggregate the batch so the rollup upsert touches each
+    # (date, hour, page_type, page_detail) key once
+    rollup = {}
+    for page_type, page_detail, ts in batch:
+        key = (ts[:10], int(ts[11:13]), page_type, page_detail or '')
+        rollup[key] = rollup.get(key, 0) + 1
+    try:
+        if _writer_conn is None:
+            _writer_conn = _init_conn(
+                sqlite3.connect(DATABASE_PATH, check_same_thread=False))
+            _writer_conn.isolation_level = None
+        conn = _writer_conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany("""
+                INSERT INTO page_views (page_type, page_detail, timestamp)
+                VALUES (?, ?, ?)
+            """, batch)
+            conn.executemany("""
+                INSERT INTO page_view_daily (date, hour, page_type, page_detail, count)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(date, hour, page_type, page_detail)
+                DO UPDATE SET count = count + excluded.count
+            """, [key + (n,) for key, n in rollup.items()])
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    except Exception as e:
+        # Don't let analytics failures break the app
+        logger.warning(f"Failed to record page views: {e}")
+
+
+def _page_view_writer():
+    """Background loop that drains the page-view queue in batches."""
+    while True:
+        # Block for the first item, then gather more until the batch is
+        # full or the flush interval passes
+        batch = [_page_view_queue.get()]
+        deadline = time.time() + _PAGE_VIEW_FLUSH_INTERVAL
+        while len(batch) < _PAGE_VIEW_BATCH_SIZE:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_page_view_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        _flush_page_views(batch)
+
+
+def _flush_page_views_at_exit():
+    """Flush whatever is still queued when the process shuts down."""
+    batch = []
+    while True:
+        try:
+            batch.append(_page_view_queue.get_nowait())
+        except queue.Empty:
+            break
+    _flush_page_views(batch)
+
+
+threading.Thread(target=_page_view_writer, daemon=True).start()
+atexit.register(_flush_page_views_at_exit)
 
 
 def record_page_view(page_type, page_detail=None):
     """Record a page view for analytics (if not a bot)."""
     user_agent = request.headers.get('User-Agent', '')
-    
+
     if is_bot(user_agent):
         return  # Don't track bots
-    
+
+    # Timestamp is captured here because the batched insert can land
+    # seconds after the request (matches the column's UTC default)
     try:
-        with get_db_connection() as conn:
-            conn.execute("""
-                INSERT INTO page_views (page_type, page_detail)
-                VALUES (?, ?)
-            """, (page_type, page_detail))
-            conn.commit()
-    except Exception as e:
-        # Don't let analytics failures break the app
-        logger.warning(f"Failed to record page view: {e}")
+        _page_view_queue.put_nowait((
+            page_type, page_detail,
+            datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S'),
+        ))
+    except queue.Full:
+        # Dropping a view beats blocking the request on analytics
+        pass
+
+
+# Pool of reusable connections: opening SQLite is cheap but not free,
+# and pooling keeps each connection's page cache warm across requests
+_DB_POOL_SIZE = 8
+_db_pool = queue.Queue(maxsize=_DB_POOL_SIZE)
+
+
+def _init_conn(conn):
+    """Apply the performance PRAGMAs every connection should run with.
+
+    WAL lets readers run concurrently with the page-view writer,
+    synchronous=NORMAL drops the fsync-per-commit (safe under WAL),
+    and the cache/mmap settings keep hot pages resident so repeated
+    queries avoid read() syscalls entirely.
+    """
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+    conn.execute("PRAGMA mmap_size=268435456")
+    return conn
+
+
+def _new_db_connection():
+    """Open a connection with the performance PRAGMAs applied."""
+    # cached_statements keeps compiled statements alive per connection;
+    # sized to comfortably hold every distinct SQL string in this module
+    # so pooled connections never re-parse a query they have seen
+    return _init_conn(sqlite3.connect(DATABASE_PATH, check_same_thread=False,
+                                      cached_statements=256))
 
 
 @contextmanager
 def get_db_connection():
-    """Get a database connection as a context manager."""
-    conn = sqlite3.connect(DATABASE_PATH)
-    conn.row_factory = sqlite3.Row
+    """Get a pooled database connection as a context manager."""
+    try:
+        conn = _db_pool.get_nowait()
+    except queue.Empty:
+        conn = _new_db_connection()
     try:
         yield conn
     finally:
-        conn.close()
+        # Clear any open transaction before the connection is reused
+        try:
+            conn.rollback()
+            _db_pool.put_nowait(conn)
+        except (queue.Full, sqlite3.Error):
+            conn.close()
+
+
+def _column_exists(conn, table, column):
+    """Check for a column, including generated ones.
+
+    PRAGMA table_info omits generated columns, so probing it for a
+    column that schema.sql defines as GENERATED reports it missing on
+    every boot; table_xinfo lists all columns.
+    """
+    return any(row[1] == column
+               for row in conn.execute(f"PRAGMA table_xinfo({table})"))
+
+
+def _ensure_schema_upgrades():
+    """Bring databases created under an older schema up to date.
+
+    The canonical schema lives in database/schema.sql; this adds the
+    tables, generated columns, and indexes that newer read paths rely
+    on, and backfills the materialized tables once for databases that
+    predate them. Steps run independently so a failure in one (logged
+    as a warning) doesn't block the others.
+    """
+    def materialized_bests(conn):
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS athlete_event_best (
+                athlete_id INTEGER NOT NULL REFERENCES athletes(id),
+                event_id INTEGER NOT NULL REFERENCES events(id),
+                best_mark REAL NOT NULL,
+                best_result_id INTEGER NOT NULL REFERENCES results(id),
+                PRIMARY KEY (athlete_id, event_id)
+            )
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_aeb_event
+            ON athlete_event_best(event_id, best_mark)
+        """)
+
+    def results_indexes(conn):
+        # Composite indexes for the hot lookup paths (also in
+        # database/schema.sql for fresh databases)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_results_athlete_event
+            ON results(athlete_id, event_id, meet_id)
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_results_event_mark
+            ON results(event_id, mark)
+        """)
+
+    def view_hour_column(conn):
+        # view_hour is a STORED generated column on fresh databases
+        # (schema.sql); ALTER TABLE can only add VIRTUAL generated
+        # columns, which still keeps the hour expression out of the
+        # query text for older databases
+        if not _column_exists(conn, 'page_views', 'view_hour'):
+            conn.execute("""
+                ALTER TABLE page_views ADD COLUMN view_hour INTEGER
+                GENERATED ALWAYS AS (CAST(strftime('%H', timestamp) AS INTEGER)) VIRTUAL
+            """)
+
+    def meet_year_column(conn):
+        # meet_year is likewise STORED on fresh databases; indexing
+        # the virtual column still lets year filters seek instead
+        # of evaluating strftime per row
+        if not _column_exists(conn, 'meets', 'meet_year'):
+            conn.execute("""
+                ALTER TABLE meets ADD COLUMN meet_year INTEGER
+                GENERATED ALWAYS AS (CAST(strftime('%Y', meet_date) AS INTEGER)) VIRTUAL
+            """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_meets_year ON meets(meet_year)
+        """)
+
+    def relay_members_index(conn):
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_relay_members_result
+            ON relay_members(result_id, leg_order)
+        """)
+
+    def page_views_index(conn):
+        # Covers the raw time-window analytics scans so they read
+        # only the index, never the page_views base table
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_page_views_ts_type
+            ON page_views(timestamp, page_type, page_detail)
+        """)
+
+    def page_view_daily_rollup(conn):
+        # Daily rollup read by the analytics endpoints; backfilled
+        # from raw page_views the first time it appears
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS page_view_daily (
+                date TEXT NOT NULL,
+                hour INTEGER NOT NULL,
+                page_type TEXT NOT NULL,
+                page_detail TEXT NOT NULL DEFAULT '',
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (date, hour, page_type, page_detail)
+            )
+        """)
+        rollup_empty = conn.execute("""
+            SELECT (SELECT COUNT(*) FROM page_view_daily) = 0
+               AND (SELECT COUNT(*) FROM page_views) > 0
+        """).fetchone()[0]
+        if rollup_empty:
+            conn.execute("""
+                INSERT INTO page_view_daily (date, hour, page_type, page_detail, count)
+                SELECT DATE(timestamp), view_hour, page_type,
+                       COALESCE(page_detail, ''), COUNT(*)
+                FROM page_views
+                GROUP BY 1, 2, 3, 4
+            """)
+
+    def bests_backfill(conn):
+        needs_backfill = conn.execute("""
+            SELECT (SELECT COUNT(*) FROM athlete_event_best) = 0
+               AND (SELECT COUNT(*) FROM results) > 0
+        """).fetchone()[0]
+        if needs_backfill:
+            conn.execute("""
+                INSERT INTO athlete_event_best (athlete_id, event_id, best_mark, best_result_id)
+                SELECT athlete_id, event_id, mark, id
+                FROM (
+                    SELECT r.athlete_id, r.event_id, r.mark, r.id,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY r.athlete_id, r.event_id
+                               ORDER BY CASE WHEN e.lower_is_better THEN r.mark END ASC,
+                                        CASE WHEN NOT e.lower_is_better THEN r.mark END DESC
+                           ) as rn
+                    FROM results r
+                    JOIN events e ON r.event_id = e.id
+                )
+                WHERE rn = 1
+            """)
+
+    steps = (
+        materialized_bests,
+        results_indexes,
+        view_hour_column,
+        meet_year_column,
+        relay_members_index,
+        page_views_index,
+        page_view_daily_rollup,
+        bests_backfill,
+    )
+    try:
+        with get_db_connection() as conn:
+            # Each step is guarded on its own so one failure (say, a
+            # partially upgraded database) can't abort the rest
+            for step in steps:
+                try:
+                    step(conn)
+                    conn.commit()
+                except Exception as e:
+                    conn.rollback()
+                    logger.warning(f"Schema upgrade '{step.__name__}' failed: {e}")
+            # Refresh planner statistics so the query planner picks the
+            # composite indexes added above on real data distributions.
+            # Guarded separately: it is safe on its own and should run
+            # even when an upgrade step failed
+            try:
+                conn.execute("PRAGMA optimize")
+            except Exception as e:
+                logger.warning(f"PRAGMA optimize failed: {e}")
+    except Exception as e:
+        logger.warning(f"Could not run schema upgrades: {e}")
+
+
+_ensure_schema_upgrades()
 
 
 def get_db():
-    """Get database connection for request context."""
+    """Get a pooled database connection for the request context."""
     if 'db' not in g:
-        g.db = sqlite3.connect(DATABASE_PATH)
-        g.db.row_factory = sqlite3.Row
+        try:
+            g.db = _db_pool.get_nowait()
+        except queue.Empty:
+            g.db = _new_db_connection()
     return g.db
 
 
 @app.teardown_appcontext
 def close_db(exception):
-    """Close database connection at end of request."""
+    """Return the request's connection to the pool at end of request."""
     db = g.pop('db', None)
     if db is not None:
-        db.close()
+        try:
+            db.rollback()
+            _db_pool.put_nowait(db)
+        except (queue.Full, sqlite3.Error):
+            db.close()
 
 
 # Template helpers
-def format_time(seconds):
-    """Format seconds as MM:SS.ss or SS.ss"""
-    if seconds is None:
-        return ""
-    
+
+# Field events displayed in feet/inches instead of meters
+_IMPERIAL_EVENTS = frozenset({
+    'Long Jump', 'Triple Jump', 'High Jump', 'Discus', 'Shot Put', 'Pole Vault'
+})
+
+_FEET_PER_METER = 1.0 / 0.3048
+
+
+# Marks repeat heavily across rendered rows (the same PR shows up on
+# athlete pages, team bests, and records), so the formatted strings are
+# memoized. Keys are rounded so equal marks hash to the same entry
+@lru_cache(maxsize=8192)
+def _format_time_cached(seconds):
     if seconds >= 60:
         minutes = int(seconds // 60)
         secs = seconds % 60
@@ -109,32 +462,45 @@ def format_time(seconds):
         return f"{seconds:.2f}"
 
 
+@lru_cache(maxsize=8192)
+def _format_imperial_cached(mark):
+    feet = mark * _FEET_PER_METER
+    whole_feet = int(feet)
+    inches = (feet - whole_feet) * 12
+    return f"{whole_feet}' {inches:.1f}\""
+
+
+def format_time(seconds):
+    """Format seconds as MM:SS.ss or SS.ss"""
+    if seconds is None:
+        return ""
+    return _format_time_cached(round(seconds, 2))
+
+
 def format_mark(mark, is_timed=True, event_name=None):
     """Format a mark appropriately based on event type."""
     if mark is None:
         return ""
-    
+
     if is_timed:
         return format_time(mark)
+    elif event_name and event_name in _IMPERIAL_EVENTS:
+        # Convert meters to feet/inches for jumps and throws
+        return _format_imperial_cached(round(mark, 4))
     else:
-        jump_events = ['Long Jump', 'Triple Jump', 'High Jump', 'Discus', 'Shot Put', 'Pole Vault']
-        if event_name and event_name in jump_events:
-            # Convert meters to feet/inches for jumps
-            feet = mark / 0.3048
-            whole_feet = int(feet)
-            inches = (feet - whole_feet) * 12
-            return f"{whole_feet}' {inches:.1f}\""
-        else:
-            # Show other field events in meters
-            return f"{mark:.2f}m"
+        # Show other field events in meters
+        return f"{mark:.2f}m"
 
 # Register filters
 app.jinja_env.filters['format_time'] = format_time
 app.jinja_env.filters['format_mark'] = format_mark
 
 
-def get_available_years():
-    """Get all years that have records, ordered with newest first."""
+# The year list only changes when a meet from a new season is ingested,
+# yet the context processor needs it on every request. Memoize it in
+# 5-minute buckets: the epoch argument makes stale entries miss
+@lru_cache(maxsize=4)
+def _available_years_cached(epoch):
     with get_db_connection() as conn:
         years = conn.execute("""
             SELECT DISTINCT strftime('%Y', meet_date) as year
@@ -145,6 +511,18 @@ def get_available_years():
     return [int(y['year']) for y in years if y['year']]
 
 
+def get_available_years():
+    """Get all years that have records, ordered with newest first."""
+    return _available_years_cached(int(time.time() // 300))
+
+
+@app.before_request
+def load_year_context():
+    """Stash the (memoized) year list on g once per request so the
+    context processor and year-filter helpers share one lookup."""
+    g.available_years = get_available_years()
+
+
 def get_current_year_filter():
     """Get the current year filter from request args, defaulting to newest year."""
     year_param = request.args.get('year', '')
@@ -156,13 +534,13 @@ def get_current_year_filter():
         except ValueError:
             pass
     # Default to newest year
-    years = get_available_years()
+    years = g.get('available_years') or get_available_years()
     return years[0] if years else None
 
 
 def get_ordered_years():
     """Get years in the order: newest, 'all', then rest descending."""
-    years = get_available_years()
+    years = g.get('available_years') or get_available_years()
     if not years:
         return []
     newest = years[0]
@@ -180,7 +558,7 @@ def add_year_filter_to_query(base_query, year_filter, meet_alias='m', params=Non
     if params is None:
         params = []
     if year_filter and year_filter != 'all':
-        base_query += f" AND strftime('%Y', {meet_alias}.meet_date) = ?"
+        base_query += f" AND {meet_alias}.meet_year = ?"
         params.append(str(year_filter))
     return base_query, params
 
@@ -188,25 +566,33 @@ def add_year_filter_to_query(base_query, year_filter, meet_alias='m', params=Non
 @app.context_processor
 def inject_year_filter():
     """Make year filter data available to all templates."""
+    ordered_years = get_ordered_years()
+    default_year = ordered_years[0][0] if ordered_years else ''
     return {
-        'available_years': get_ordered_years(),
-        'current_year': request.args.get('year', str(get_available_years()[0]) if get_available_years() else ''),
+        'available_years': ordered_years,
+        'current_year': request.args.get('year', default_year),
     }
 
 
-# Routes
-@app.route('/')
-def index():
-    """Dashboard / home page."""
-    record_page_view('home')
-    year_filter = get_current_year_filter()
-    
+# Home page aggregates only change when new meets are ingested, so cache
+# them per year filter for a short TTL instead of re-running the
+# aggregate scans on every hit
+_HOME_STATS_TTL = 60  # seconds
+_home_stats_cache = {}
+
+
+def _home_stats(year_filter):
+    """Get (stats, recent_meets, top_events) for the home page, cached."""
+    cached = _home_stats_cache.get(year_filter)
+    if cached and time.time() - cached[0] < _HOME_STATS_TTL:
+        return cached[1]
+
     with get_db_connection() as conn:
         # Build year filter clause
         year_clause = ""
         year_params = []
         if year_filter and year_filter != 'all':
-            year_clause = "WHERE strftime('%Y', m.meet_date) = ?"
+            year_clause = "WHERE m.meet_year = ?"
             year_params = [str(year_filter)]
         
         # Get recent meets (filtered by year)
@@ -229,52 +615,34 @@ def index():
         """
         recent_meets = conn.execute(meets_query, year_params).fetchall()
         
-        # Get athlete count (for the year)
-        if year_filter and year_filter != 'all':
-            athlete_count = conn.execute("""
-                SELECT COUNT(DISTINCT r.athlete_id) FROM results r
-                JOIN meets m ON r.meet_id = m.id
-                WHERE strftime('%Y', m.meet_date) = ?
-            """, [str(year_filter)]).fetchone()[0]
-        else:
-            athlete_count = conn.execute("SELECT COUNT(*) FROM athletes").fetchone()[0]
-        
-        # Get result count (for the year)
-        if year_filter and year_filter != 'all':
-            result_count = conn.execute("""
-                SELECT COUNT(*) FROM results r
-                JOIN meets m ON r.meet_id = m.id
-                WHERE strftime('%Y', m.meet_date) = ?
-            """, [str(year_filter)]).fetchone()[0]
-        else:
-            result_count = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
-        
-        # Get meet count (for the year)
-        if year_filter and year_filter != 'all':
-            meet_count = conn.execute("""
-                SELECT COUNT(*) FROM meets
-                WHERE strftime('%Y', meet_date) = ?
-            """, [str(year_filter)]).fetchone()[0]
-        else:
-            meet_count = conn.execute("SELECT COUNT(*) FROM meets").fetchone()[0]
-        
-        # Get seasons
-        seasons = conn.execute("""
-            SELECT DISTINCT season FROM meets 
-            WHERE season IS NOT NULL 
-            ORDER BY season DESC
-        """).fetchall()
-        
-        # Get event count (for the year)
+        # Get athlete/result/meet/event counts (for the year) in one
+        # statement instead of four round trips
         if year_filter and year_filter != 'all':
-            event_count = conn.execute("""
-                SELECT COUNT(DISTINCT r.event_id) FROM results r
+            # One scan over the year's results covers the athlete,
+            # result, and event counts; only the meet count (which must
+            # include meets with no results) needs its own subquery
+            year = str(year_filter)
+            counts = conn.execute("""
+                SELECT
+                    COUNT(DISTINCT r.athlete_id),
+                    COUNT(*),
+                    (SELECT COUNT(*) FROM meets
+                     WHERE meet_year = ?),
+                    COUNT(DISTINCT r.event_id)
+                FROM results r
                 JOIN meets m ON r.meet_id = m.id
-                WHERE strftime('%Y', m.meet_date) = ?
-            """, [str(year_filter)]).fetchone()[0]
+                WHERE m.meet_year = ?
+            """, [year, year]).fetchone()
         else:
-            event_count = conn.execute("SELECT COUNT(DISTINCT event_id) FROM results").fetchone()[0]
-        
+            counts = conn.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM athletes),
+                    (SELECT COUNT(*) FROM results),
+                    (SELECT COUNT(*) FROM meets),
+                    (SELECT COUNT(DISTINCT event_id) FROM results)
+            """).fetchone()
+        athlete_count, result_count, meet_count, event_count = counts
+
         # Get top events by result count (for the year)
         if year_filter and year_filter != 'all':
             top_events = conn.execute("""
@@ -282,7 +650,7 @@ def index():
                 FROM results r
                 JOIN events e ON r.event_id = e.id
                 JOIN meets m ON r.meet_id = m.id
-                WHERE strftime('%Y', m.meet_date) = ?
+                WHERE m.meet_year = ?
                 GROUP BY e.id, e.name
                 ORDER BY result_count DESC
                 LIMIT 5
@@ -296,43 +664,140 @@ def index():
                 ORDER BY result_count DESC
                 LIMIT 5
             """).fetchall()
-    
-    return render_template('index.html',
-        stats={
+
+    # Store plain dicts so cached entries don't hold Row objects tied to
+    # a closed connection
+    payload = (
+        {
             'athletes': athlete_count,
             'results': result_count,
             'meets': meet_count,
             'events': event_count
         },
+        [dict(m) for m in recent_meets],
+        [dict(e) for e in top_events],
+    )
+    _home_stats_cache[year_filter] = (time.time(), payload)
+    return payload
+
+
+# Rendered-page cache for views whose data only changes when the
+# scraper ingests a meet. Identical URLs (path + query string) serve
+# the cached HTML for the TTL; page views are still recorded on hits
+_PAGE_CACHE_TTL = 300  # seconds
+_PAGE_CACHE_MAX = 256  # entries
+_page_cache = {}
+
+
+def _page_cache_store(key, now, page):
+    """Insert a rendered page, keeping the cache bounded.
+
+    The cached routes accept arbitrary query strings, so unrepeated
+    URLs (tracking params, bad year values) must not pin pages in
+    worker memory forever: at the cap, drop expired entries first,
+    then the oldest, before inserting.
+    """
+    if len(_page_cache) >= _PAGE_CACHE_MAX and key not in _page_cache:
+        for k in [k for k, (ts, _) in _page_cache.items()
+                  if now - ts >= _PAGE_CACHE_TTL]:
+            _page_cache.pop(k, None)
+        while len(_page_cache) >= _PAGE_CACHE_MAX:
+            oldest = min(_page_cache, key=lambda k: _page_cache[k][0])
+            _page_cache.pop(oldest, None)
+    _page_cache[key] = (now, page)
+
+
+def cached_page(page_type, detail=None):
+    """Cache a view's rendered HTML per URL and record its page view.
+
+    `detail` is an optional callable (run in request context) producing
+    the page_detail for analytics. Only plain string responses are
+    cached, so error tuples pass through uncached.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            record_page_view(page_type, detail(**kwargs) if detail else None)
+            key = request.full_path
+            now = time.time()
+            hit = _page_cache.get(key)
+            if hit and now - hit[0] < _PAGE_CACHE_TTL:
+                return hit[1]
+            rv = view(*args, **kwargs)
+            if isinstance(rv, str):
+                _page_cache_store(key, now, rv)
+            return rv
+        return wrapper
+    return decorator
+
+
+@app.route('/admin/flush-cache/<secret>')
+def flush_page_cache(secret):
+    """Drop cached pages and stats; hit by the loader after ingest."""
+    if secret != ANALYTICS_SECRET:
+        return render_template('error.html', error="Page not found"), 404
+    _page_cache.clear()
+    _home_stats_cache.clear()
+    return jsonify({'flushed': True})
+
+
+# Routes
+@app.route('/')
+@cached_page('home')
+def index():
+    """Dashboard / home page."""
+    year_filter = get_current_year_filter()
+    stats, recent_meets, top_events = _home_stats(year_filter)
+
+    return render_template('index.html',
+        stats=stats,
         recent_meets=recent_meets,
         top_events=top_events
     )
 
 
 @app.route('/communications')
+@cached_page('communications')
 def communications():
     """Team communications page with schedule, staff, and Band app link."""
-    record_page_view('communications')
     return render_template('communications.html')
 
 
+# Page size for the athletes list keyset pagination
+ATHLETES_PAGE_SIZE = 50
+
+
 @app.route('/athletes')
 def athletes_list():
-    """List all athletes."""
+    """List all athletes, paginated with a keyset cursor."""
     record_page_view('athletes_list')
     gender_filter = request.args.get('gender', '')
     year_filter = get_current_year_filter()
-    
+
+    # Keyset cursor: "last_name|first_name|id" of the last row on the
+    # previous page. Unlike OFFSET, resuming from the key does work
+    # proportional to the page size, not the scroll depth
+    cursor_clause = ""
+    cursor_params = []
+    after = request.args.get('after', '')
+    if after:
+        parts = after.rsplit('|', 2)
+        if len(parts) == 3 and parts[2].isdigit():
+            cursor_clause = " AND (a.last_name, a.first_name, a.id) > (?, ?, ?)"
+            cursor_params = [parts[0], parts[1], int(parts[2])]
+
     with get_db_connection() as conn:
         # Build the base query with year filter
         if year_filter and year_filter != 'all':
             query = """
-                SELECT 
+                SELECT
                     a.id,
+                    a.first_name,
+                    a.last_name,
                     a.first_name || ' ' || a.last_name as name,
                     a.gender,
                     a.graduation_year,
-                    CASE 
+                    CASE
                         WHEN a.graduation_year = 2026 THEN '12th'
                         WHEN a.graduation_year = 2027 THEN '11th'
                         WHEN a.graduation_year = 2028 THEN '10th'
@@ -344,24 +809,19 @@ def athletes_list():
                 FROM athletes a
                 INNER JOIN results r ON a.id = r.athlete_id
                 INNER JOIN meets m ON r.meet_id = m.id
-                WHERE strftime('%Y', m.meet_date) = ?
+                WHERE m.meet_year = ?
             """
             params = [str(year_filter)]
-            
-            if gender_filter:
-                query += " AND a.gender = ?"
-                params.append(gender_filter)
-            
-            query += " GROUP BY a.id ORDER BY a.last_name, a.first_name"
-            athletes = conn.execute(query, params).fetchall()
         else:
             query = """
-                SELECT 
+                SELECT
                     a.id,
+                    a.first_name,
+                    a.last_name,
                     a.first_name || ' ' || a.last_name as name,
                     a.gender,
                     a.graduation_year,
-                    CASE 
+                    CASE
                         WHEN a.graduation_year = 2026 THEN '12th'
                         WHEN a.graduation_year = 2027 THEN '11th'
                         WHEN a.graduation_year = 2028 THEN '10th'
@@ -372,19 +832,32 @@ def athletes_list():
                     COUNT(r.id) as result_count
                 FROM athletes a
                 LEFT JOIN results r ON a.id = r.athlete_id
+                WHERE 1=1
             """
-            
-            if gender_filter:
-                query += " WHERE a.gender = ?"
-                query += " GROUP BY a.id ORDER BY a.last_name, a.first_name"
-                athletes = conn.execute(query, (gender_filter,)).fetchall()
-            else:
-                query += " GROUP BY a.id ORDER BY a.last_name, a.first_name"
-                athletes = conn.execute(query).fetchall()
-    
-    return render_template('athletes_list.html', 
+            params = []
+
+        if gender_filter:
+            query += " AND a.gender = ?"
+            params.append(gender_filter)
+
+        query += cursor_clause
+        params.extend(cursor_params)
+
+        # Fetch one extra row to know whether a next page exists
+        query += " GROUP BY a.id ORDER BY a.last_name, a.first_name, a.id LIMIT ?"
+        params.append(ATHLETES_PAGE_SIZE + 1)
+        rows = conn.execute(query, params).fetchall()
+
+    athletes = rows[:ATHLETES_PAGE_SIZE]
+    next_cursor = None
+    if len(rows) > ATHLETES_PAGE_SIZE:
+        last = athletes[-1]
+        next_cursor = f"{last['last_name']}|{last['first_name']}|{last['id']}"
+
+    return render_template('athletes_list.html',
         athletes=athletes,
-        gender_filter=gender_filter
+        gender_filter=gender_filter,
+        next_cursor=next_cursor
     )
 
 
@@ -418,9 +891,15 @@ def athlete_stats(athlete_id):
         # Convert to dict for easier template access
         athlete = dict(athlete_row)
         
-        # Get PRs for this athlete
-        prs = conn.execute("""
-            SELECT 
+        # One statement covers both the PR list and the full results:
+        # every result row is tagged is_pr by comparing against the
+        # materialized best result for its event, and a single pass
+        # builds all three structures the template needs
+        results_by_event = {}
+        results = []
+        prs = []
+        cursor = conn.execute("""
+            SELECT
                 e.id as event_id,
                 e.name as event_name,
                 e.timed,
@@ -428,55 +907,36 @@ def athlete_stats(athlete_id):
                 r.mark,
                 r.mark as result_value,
                 r.mark_display,
-                m.meet_date,
-                m.name as meet_name
-            FROM results r
-            JOIN events e ON r.event_id = e.id
-            JOIN meets m ON r.meet_id = m.id
-            WHERE r.athlete_id = ?
-            AND r.mark = (
-                SELECT CASE 
-                    WHEN e.lower_is_better THEN MIN(r2.mark)
-                    ELSE MAX(r2.mark)
-                END
-                FROM results r2
-                WHERE r2.athlete_id = r.athlete_id 
-                AND r2.event_id = r.event_id
-            )
-            ORDER BY e.name
-        """, (athlete_id,)).fetchall()
-        
-        # Get all results grouped by event
-        results_by_event = {}
-        results = conn.execute("""
-            SELECT 
-                e.id as event_id,
-                e.name as event_name,
-                e.timed,
-                r.mark,
-                r.mark_display,
                 r.place,
                 r.level,
                 r.wind,
                 m.meet_date,
                 m.name as meet_name,
-                m.season
+                m.season,
+                (ab.best_result_id = r.id) as is_pr
             FROM results r
             JOIN events e ON r.event_id = e.id
             JOIN meets m ON r.meet_id = m.id
+            LEFT JOIN athlete_event_best ab
+                ON ab.athlete_id = r.athlete_id AND ab.event_id = r.event_id
             WHERE r.athlete_id = ?
             ORDER BY e.name, m.meet_date DESC
-        """, (athlete_id,)).fetchall()
-        
-        for result in results:
+        """, (athlete_id,))
+        cursor.arraysize = 500
+
+        for result in cursor:
+            results.append(result)
+            if result['is_pr']:
+                prs.append(result)
             event_name = result['event_name']
-            if event_name not in results_by_event:
-                results_by_event[event_name] = {
+            bucket = results_by_event.get(event_name)
+            if bucket is None:
+                bucket = results_by_event[event_name] = {
                     'event_id': result['event_id'],
                     'timed': result['timed'],
                     'results': []
                 }
-            results_by_event[event_name]['results'].append(result)
+            bucket['results'].append(result)
     
     return render_template('athlete_stats.html',
         athlete=athlete,
@@ -487,11 +947,13 @@ def athlete_stats(athlete_id):
 
 
 @app.route('/team-bests')
+@cached_page('team_bests',
+             detail=lambda: f"{get_current_year_filter() or 'all'}_"
+                            f"{request.args.get('gender') or 'all'}")
 def team_bests():
     """Team bests by event."""
     gender = request.args.get('gender', '')
     year_filter = get_current_year_filter()
-    record_page_view('team_bests', page_detail=f"{year_filter or 'all'}_{gender or 'all'}")
     
     with get_db_connection() as conn:
         # Get available years (for reference, though we use the global year filter)
@@ -501,64 +963,80 @@ def team_bests():
             ORDER BY year DESC
         """).fetchall()
         
-        # Build query for team bests with year filter
-        query = """
-            SELECT 
-                e.id as event_id,
-                e.name as event_name,
-                e.category,
-                e.timed,
-                a.gender,
-                r.mark,
-                r.mark_display,
-                a.first_name || ' ' || a.last_name as athlete_name,
-                a.id as athlete_id,
-                m.meet_date,
-                m.name as meet_name
-            FROM results r
-            JOIN athletes a ON r.athlete_id = a.id
-            JOIN events e ON r.event_id = e.id
-            JOIN meets m ON r.meet_id = m.id
-            WHERE 1=1
-        """
-        params = []
-        
-        if year_filter and year_filter != 'all':
-            query += " AND strftime('%Y', m.meet_date) = ?"
-            params.append(str(year_filter))
-        
-        if gender:
-            query += " AND a.gender = ?"
-            params.append(gender)
-        
-        query += """
-            AND r.mark = (
-                SELECT CASE 
-                    WHEN e.lower_is_better THEN MIN(r2.mark)
-                    ELSE MAX(r2.mark)
-                END
-                FROM results r2
-                JOIN athletes a2 ON r2.athlete_id = a2.id
-                JOIN meets m2 ON r2.meet_id = m2.id
-                WHERE r2.event_id = e.id
-                AND a2.gender = a.gender
-        """
-        
+        # Team bests: rank within each (event, gender) group by the
+        # event's better-direction and keep rank 1. The all-years path
+        # ranks the materialized per-athlete bests (O(athletes x events)
+        # rows); only year-filtered views scan the results table. The
+        # "? IS NULL OR ..." gender filter keeps each SQL text constant
+        # so the prepared statement is reused
+        gender_param = gender or None
         if year_filter and year_filter != 'all':
-            query += " AND strftime('%Y', m2.meet_date) = ?"
-            params.append(str(year_filter))
-        
-        query += """
-            )
-            GROUP BY e.id, a.gender
-            ORDER BY a.gender, e.category, e.name
-        """
-        
-        team_bests_results = conn.execute(query, params).fetchall()
+            team_bests_results = conn.execute("""
+                WITH ranked AS (
+                    SELECT
+                        e.id as event_id,
+                        e.name as event_name,
+                        e.category,
+                        e.timed,
+                        a.gender,
+                        r.mark,
+                        r.mark_display,
+                        a.first_name || ' ' || a.last_name as athlete_name,
+                        a.id as athlete_id,
+                        m.meet_date,
+                        m.name as meet_name,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY e.id, a.gender
+                            ORDER BY CASE WHEN e.lower_is_better THEN r.mark END ASC,
+                                     CASE WHEN NOT e.lower_is_better THEN r.mark END DESC
+                        ) as rn
+                    FROM results r
+                    JOIN athletes a ON r.athlete_id = a.id
+                    JOIN events e ON r.event_id = e.id
+                    JOIN meets m ON r.meet_id = m.id
+                    WHERE m.meet_year = ?
+                    AND (? IS NULL OR a.gender = ?)
+                )
+                SELECT * FROM ranked
+                WHERE rn = 1
+                ORDER BY gender, category, event_name
+            """, [str(year_filter), gender_param, gender_param]).fetchall()
+        else:
+            team_bests_results = conn.execute("""
+                WITH ranked AS (
+                    SELECT
+                        e.id as event_id,
+                        e.name as event_name,
+                        e.category,
+                        e.timed,
+                        a.gender,
+                        r.mark,
+                        r.mark_display,
+                        a.first_name || ' ' || a.last_name as athlete_name,
+                        a.id as athlete_id,
+                        m.meet_date,
+                        m.name as meet_name,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY e.id, a.gender
+                            ORDER BY CASE WHEN e.lower_is_better THEN ab.best_mark END ASC,
+                                     CASE WHEN NOT e.lower_is_better THEN ab.best_mark END DESC
+                        ) as rn
+                    FROM athlete_event_best ab
+                    JOIN results r ON r.id = ab.best_result_id
+                    JOIN athletes a ON ab.athlete_id = a.id
+                    JOIN events e ON ab.event_id = e.id
+                    JOIN meets m ON r.meet_id = m.id
+                    WHERE (? IS NULL OR a.gender = ?)
+                )
+                SELECT * FROM ranked
+                WHERE rn = 1
+                ORDER BY gender, category, event_name
+            """, [gender_param, gender_param]).fetchall()
         
-        # Group by gender
-        boys_bests = [tb for tb in team_bests_results if tb['gender'] == 'M']
-        girls_bests = [tb for tb in team_bests_results if tb['gender'] == 'F']
+        # Group by gender in a single pass
+        boys_bests, girls_bests = [], []
+        for tb in team_bests_results:
+            (boys_bests if tb['gender'] == 'M' else girls_bests).append(tb)
     
     return render_template('team_bests.html',
         boys_bests=boys_bests,
@@ -571,10 +1049,16 @@ def team_bests():
     )
 
 
+@lru_cache(maxsize=256)
+def _relay_name_fallback(event_name):
+    """Relay detection for legacy rows where events.is_relay is unset."""
+    return 'relay' in event_name.casefold()
+
+
 @app.route('/event/<event_name>')
+@cached_page('event', detail=lambda event_name: event_name)
 def event_records(event_name):
     """Event records - PR list for an event."""
-    record_page_view('event', page_detail=event_name)
     year_filter = get_current_year_filter()
     
     with get_db_connection() as conn:
@@ -586,17 +1070,22 @@ def event_records(event_name):
         if not event:
             return render_template('error.html', error="Event not found"), 404
         
-        # Check if this is a relay event
-        is_relay = event['is_relay'] or 'relay' in event_name.lower()
+        # Trust the is_relay column (the loader sets it from the
+        # canonical event config); the name check only covers legacy
+        # rows and its result is memoized per event name
+        is_relay = bool(event['is_relay']) or _relay_name_fallback(event_name)
         
         if is_relay:
             # For relay events, get unique results with all team members
             men_records = get_relay_records(conn, event['id'], 'M', year_filter, event['lower_is_better'])
             women_records = get_relay_records(conn, event['id'], 'F', year_filter, event['lower_is_better'])
         else:
-            # For individual events, get best mark per athlete
-            men_records = get_individual_records(conn, event['id'], 'M', year_filter, event['lower_is_better'])
-            women_records = get_individual_records(conn, event['id'], 'F', year_filter, event['lower_is_better'])
+            # For individual events, get best mark per athlete. One
+            # query returns both genders; split the rows in Python
+            # instead of preparing and running the same SQL twice
+            men_records, women_records = [], []
+            for row in get_individual_records(conn, event['id'], year_filter, event['lower_is_better']):
+                (men_records if row['gender'] == 'M' else women_records).append(row)
         
         logger.info(f"Event: {event['name']}, Men's records: {len(men_records)}, Women's records: {len(women_records)}")
     
@@ -610,121 +1099,148 @@ def event_records(event_name):
     )
 
 
-def get_individual_records(conn, event_id, gender, year_filter, lower_is_better):
-    """Get individual event records - one entry per athlete (their best)."""
-    agg_func = 'MIN(r.mark)' if lower_is_better else 'MAX(r.mark)'
-    
-    # Year filter clause for CTE
-    year_cte_clause = ""
-    if year_filter and year_filter != 'all':
-        year_cte_clause = f" AND strftime('%Y', m.meet_date) = '{year_filter}'"
-    
-    query = f"""
-        WITH athlete_bests AS (
-            SELECT 
-                a.id,
-                {agg_func} as best_mark
+def _build_record_queries():
+    """Render every variant of the record queries once at import time.
+
+    The queries only vary by year filter and sort direction, so keeping
+    the four variants as constants means requests always pass identical
+    SQL text and keep hitting each connection's statement cache instead
+    of making sqlite re-parse a freshly built f-string.
+    """
+    indiv = {}
+    relay = {}
+    for lower in (True, False):
+        direction = 'ASC' if lower else 'DESC'
+        agg_func = 'MIN(r.mark)' if lower else 'MAX(r.mark)'
+        # All-years records come straight from the materialized
+        # per-athlete bests; only year-filtered views need to
+        # aggregate over results
+        indiv[(False, lower)] = f"""
+            SELECT
+                a.id as athlete_id,
+                a.first_name || ' ' || a.last_name as athlete_name,
+                a.gender,
+                a.graduation_year,
+                r.mark,
+                r.mark_display,
+                r.level,
+                m.meet_date,
+                m.name as meet_name,
+                NULL as relay_members
+            FROM athlete_event_best ab
+            JOIN results r ON r.id = ab.best_result_id
+            JOIN athletes a ON ab.athlete_id = a.id
+            JOIN meets m ON r.meet_id = m.id
+            WHERE ab.event_id = ?
+            ORDER BY a.gender, ab.best_mark {direction}
+        """
+        indiv[(True, lower)] = f"""
+            WITH athlete_bests AS (
+                SELECT
+                    a.id,
+                    {agg_func} as best_mark
+                FROM results r
+                JOIN athletes a ON r.athlete_id = a.id
+                JOIN meets m ON r.meet_id = m.id
+                WHERE r.event_id = ? AND m.meet_year = ?
+                GROUP BY a.id
+            )
+            SELECT
+                a.id as athlete_id,
+                a.first_name || ' ' || a.last_name as athlete_name,
+                a.gender,
+                a.graduation_year,
+                r.mark,
+                r.mark_display,
+                r.level,
+                m.meet_date,
+                m.name as meet_name,
+                NULL as relay_members
             FROM results r
             JOIN athletes a ON r.athlete_id = a.id
+            JOIN athlete_bests ab ON a.id = ab.id AND r.mark = ab.best_mark
             JOIN meets m ON r.meet_id = m.id
-            WHERE r.event_id = ? AND a.gender = ?{year_cte_clause}
-            GROUP BY a.id
-        )
-        SELECT 
-            a.id as athlete_id,
-            a.first_name || ' ' || a.last_name as athlete_name,
-            a.gender,
-            a.graduation_year,
-            r.mark,
-            r.mark_display,
-            r.level,
-            m.meet_date,
-            m.name as meet_name,
-            NULL as relay_members
-        FROM results r
-        JOIN athletes a ON r.athlete_id = a.id
-        JOIN athlete_bests ab ON a.id = ab.id AND r.mark = ab.best_mark
-        JOIN meets m ON r.meet_id = m.id
-        WHERE r.event_id = ?
-    """
-    
-    params = [event_id, gender, event_id]
-    
-    if year_filter and year_filter != 'all':
-        query += " AND strftime('%Y', m.meet_date) = ?"
-        params.append(str(year_filter))
-    
-    query += " ORDER BY "
-    if lower_is_better:
-        query += "r.mark ASC"
-    else:
-        query += "r.mark DESC"
-    
-    return conn.execute(query, params).fetchall()
+            WHERE r.event_id = ? AND m.meet_year = ?
+            ORDER BY a.gender, r.mark {direction}
+        """
+        for has_year in (True, False):
+            year_clause = " AND m.meet_year = ?" if has_year else ""
+            relay[(has_year, lower)] = f"""
+                SELECT
+                    r.id as result_id,
+                    a.id as athlete_id,
+                    a.first_name || ' ' || a.last_name as athlete_name,
+                    a.gender,
+                    a.graduation_year,
+                    r.mark,
+                    r.mark_display,
+                    r.level,
+                    m.meet_date,
+                    m.name as meet_name
+                FROM results r
+                JOIN athletes a ON r.athlete_id = a.id
+                JOIN meets m ON r.meet_id = m.id
+                WHERE r.event_id = ? AND a.gender = ?{year_clause}
+                ORDER BY r.mark {direction}
+            """
+    return indiv, relay
+
+
+_INDIV_RECORDS_SQL, _RELAY_RECORDS_SQL = _build_record_queries()
+
+
+def get_individual_records(conn, event_id, year_filter, lower_is_better):
+    """Get individual event records for both genders - one entry per
+    athlete (their best), ordered by gender then mark."""
+    has_year = bool(year_filter and year_filter != 'all')
+    query = _INDIV_RECORDS_SQL[(has_year, bool(lower_is_better))]
+    if not has_year:
+        return conn.execute(query, (event_id,)).fetchall()
+    year = str(year_filter)
+    return conn.execute(query, (event_id, year, event_id, year)).fetchall()
 
 
 def get_relay_records(conn, event_id, gender, year_filter, lower_is_better):
     """Get relay event records - show all team members for each result."""
-    # Year filter clause
-    year_clause = ""
+    has_year = bool(year_filter and year_filter != 'all')
     params = [event_id, gender]
-    if year_filter and year_filter != 'all':
-        year_clause = " AND strftime('%Y', m.meet_date) = ?"
+    if has_year:
         params.append(str(year_filter))
-    
-    # Get all results for this relay event
-    query = f"""
-        SELECT 
-            r.id as result_id,
-            a.id as athlete_id,
-            a.first_name || ' ' || a.last_name as athlete_name,
-            a.gender,
-            a.graduation_year,
-            r.mark,
-            r.mark_display,
-            r.level,
-            m.meet_date,
-            m.name as meet_name
-        FROM results r
-        JOIN athletes a ON r.athlete_id = a.id
-        JOIN meets m ON r.meet_id = m.id
-        WHERE r.event_id = ? AND a.gender = ?{year_clause}
-        ORDER BY {"r.mark ASC" if lower_is_better else "r.mark DESC"}
-    """
-    
+
+    query = _RELAY_RECORDS_SQL[(has_year, bool(lower_is_better))]
     results = conn.execute(query, params).fetchall()
-    
-    # For each result, get the relay team members
-    enriched_results = []
-    for result in results:
-        # Get relay members for this result
-        members_query = """
-            SELECT 
-                a.first_name || ' ' || a.last_name as name,
-                rm.leg_order
+
+    # Fetch every team's members in one query instead of one per result
+    members_by_result = {}
+    if results:
+        result_ids = [r['result_id'] for r in results]
+        placeholders = ','.join('?' * len(result_ids))
+        member_rows = conn.execute(f"""
+            SELECT
+                rm.result_id,
+                a.first_name || ' ' || a.last_name as name
             FROM relay_members rm
             JOIN athletes a ON rm.athlete_id = a.id
-            WHERE rm.result_id = ?
-            ORDER BY rm.leg_order
-        """
-        members = conn.execute(members_query, (result['result_id'],)).fetchall()
-        
-        # Convert to dict and add relay_members
+            WHERE rm.result_id IN ({placeholders})
+            ORDER BY rm.result_id, rm.leg_order
+        """, result_ids).fetchall()
+        for row in member_rows:
+            members_by_result.setdefault(row['result_id'], []).append(row['name'])
+
+    enriched_results = []
+    for result in results:
         result_dict = dict(result)
-        if members:
-            result_dict['relay_members'] = ', '.join([m['name'] for m in members])
-        else:
-            result_dict['relay_members'] = None
-        
+        members = members_by_result.get(result['result_id'])
+        result_dict['relay_members'] = ', '.join(members) if members else None
         enriched_results.append(result_dict)
-    
+
     return enriched_results
 
 
 @app.route('/events')
+@cached_page('events_list')
 def events_list():
     """List all events."""
-    record_page_view('events_list')
     year_filter = get_current_year_filter()
     
     with get_db_connection() as conn:
@@ -739,7 +1255,7 @@ def events_list():
                 LEFT JOIN results r ON e.id = r.event_id
                 LEFT JOIN athletes a ON r.athlete_id = a.id
                 LEFT JOIN meets m ON r.meet_id = m.id
-                WHERE strftime('%Y', m.meet_date) = ? OR m.meet_date IS NULL
+                WHERE m.meet_year = ? OR m.meet_date IS NULL
                 GROUP BY e.id
                 ORDER BY e.category, e.name
             """, [str(year_filter)]).fetchall()
@@ -769,12 +1285,24 @@ def events_list():
 
 
 # API endpoints for charts
-@app.route('/api/athlete/<int:athlete_id>/progress/<int:event_id>')
-def athlete_progress_api(athlete_id, event_id):
-    """Get athlete progress data for charts."""
+
+# Progress data only changes when the scraper ingests new results, so
+# the serialized payload is cached and served conditionally. The hourly
+# version bucket is both the cache key and the ETag, so browsers that
+# already hold the current payload get a 304 instead of a re-query
+_PROGRESS_CACHE_TTL = 3600
+
+
+@lru_cache(maxsize=1024)
+def _athlete_progress_payload(athlete_id, event_id, version):
+    """Build the serialized progress JSON for one athlete/event."""
+    dates, marks, displays, meets = [], [], [], []
+    timed = True
     with get_db_connection() as conn:
-        results = conn.execute("""
-            SELECT 
+        # One pass with tuple unpacking: positional access instead of
+        # four comprehensions doing string-keyed Row lookups per field
+        for mark, mark_display, meet_date, meet_name, timed in conn.execute("""
+            SELECT
                 r.mark,
                 r.mark_display,
                 m.meet_date,
@@ -785,17 +1313,33 @@ def athlete_progress_api(athlete_id, event_id):
             JOIN events e ON r.event_id = e.id
             WHERE r.athlete_id = ? AND r.event_id = ?
             ORDER BY m.meet_date
-        """, (athlete_id, event_id)).fetchall()
-        
-        data = {
-            'dates': [r['meet_date'] for r in results],
-            'marks': [r['mark'] for r in results],
-            'displays': [r['mark_display'] for r in results],
-            'meets': [r['meet_name'] for r in results],
-            'timed': results[0]['timed'] if results else True
-        }
-    
-    return jsonify(data)
+        """, (athlete_id, event_id)):
+            dates.append(meet_date)
+            marks.append(mark)
+            displays.append(mark_display)
+            meets.append(meet_name)
+
+    data = {
+        'dates': dates,
+        'marks': marks,
+        'displays': displays,
+        'meets': meets,
+        'timed': timed,
+    }
+    return app.json.dumps(data)
+
+
+@app.route('/api/athlete/<int:athlete_id>/progress/<int:event_id>')
+def athlete_progress_api(athlete_id, event_id):
+    """Get athlete progress data for charts."""
+    version = int(time.time() // _PROGRESS_CACHE_TTL)
+    body = _athlete_progress_payload(athlete_id, event_id, version)
+
+    response = app.response_class(body, mimetype='application/json')
+    response.set_etag(f'{athlete_id}-{event_id}-{version}')
+    response.cache_control.public = True
+    response.cache_control.max_age = _PROGRESS_CACHE_TTL
+    return response.make_conditional(request)
 
 
 # Hidden Analytics Page
@@ -808,76 +1352,127 @@ def analytics_dashboard(secret):
     return render_template('analytics.html', secret=secret)
 
 
+# Dashboards poll these endpoints every few seconds; serialized payloads
+# are cached in 30-second buckets and served conditionally with an ETag
+_ANALYTICS_CACHE_TTL = 30  # seconds
+
+
+def _window_start(days):
+    """Start date (YYYY-MM-DD) for an N-day analytics window."""
+    return (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+
+
+def _analytics_response(body, name, days, bucket):
+    """Wrap a cached analytics payload with ETag/Cache-Control."""
+    response = app.response_class(body, mimetype='application/json')
+    response.set_etag(f'{name}-{days}-{bucket}')
+    response.cache_control.private = True
+    response.cache_control.max_age = _ANALYTICS_CACHE_TTL
+    return response.make_conditional(request)
+
+
+@lru_cache(maxsize=32)
+def _summary_payload(days, bucket):
+    """Build the serialized analytics summary for one window."""
+    start_date = _window_start(days)
+
+    # One statement covers every breakdown: the filtered rollup window
+    # is materialized once and each aggregation reads it, tagged so
+    # Python can dispatch rows into the right list. The rollup itself
+    # is maintained by the page-view writer thread
+    with get_db_connection() as conn:
+        rows = conn.execute("""
+            WITH filtered AS (
+                SELECT date, hour, page_type, page_detail, count
+                FROM page_view_daily
+                WHERE date >= ?
+            )
+            SELECT 'by_page_type' as tag, page_type as k1, NULL as k2,
+                   SUM(count) as count
+            FROM filtered GROUP BY page_type
+            UNION ALL
+            SELECT 'daily', date, page_type, SUM(count)
+            FROM filtered GROUP BY date, page_type
+            UNION ALL
+            SELECT 'events', NULLIF(page_detail, ''), NULL, SUM(count)
+            FROM filtered WHERE page_type = 'event' GROUP BY page_detail
+            UNION ALL
+            SELECT 'team_bests', NULLIF(page_detail, ''), NULL, SUM(count)
+            FROM filtered WHERE page_type = 'team_bests' GROUP BY page_detail
+            UNION ALL
+            SELECT 'hourly', hour, NULL, SUM(count)
+            FROM filtered GROUP BY hour
+        """, (start_date,)).fetchall()
+
+    by_page_type, daily, events, team_bests_breakdown, hourly = [], [], [], [], []
+    for tag, k1, k2, count in rows:
+        if tag == 'by_page_type':
+            by_page_type.append({'page_type': k1, 'count': count})
+        elif tag == 'daily':
+            daily.append({'date': k1, 'page_type': k2, 'count': count})
+        elif tag == 'events':
+            events.append({'event': k1, 'count': count})
+        elif tag == 'team_bests':
+            team_bests_breakdown.append({'detail': k1, 'count': count})
+        else:
+            hourly.append({'hour': k1, 'count': count})
+
+    # Per-section ordering, formerly each query's ORDER BY
+    by_page_type.sort(key=lambda r: r['count'], reverse=True)
+    daily.sort(key=lambda r: r['date'])
+    events.sort(key=lambda r: r['count'], reverse=True)
+    team_bests_breakdown.sort(key=lambda r: r['count'], reverse=True)
+    hourly.sort(key=lambda r: r['hour'])
+
+    return app.json.dumps({
+        'period_days': days,
+        'start_date': start_date,
+        'total_views': sum(r['count'] for r in by_page_type),
+        'by_page_type': by_page_type,
+        'daily': daily,
+        'events': events,
+        'team_bests': team_bests_breakdown,
+        'hourly': hourly
+    })
+
+
 @app.route('/api/analytics/<secret>/summary')
 def analytics_summary(secret):
     """Get analytics summary data."""
     if secret != ANALYTICS_SECRET:
         return jsonify({'error': 'Unauthorized'}), 403
-    
+
     days = request.args.get('days', 30, type=int)
-    start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-    
+    bucket = int(time.time() // _ANALYTICS_CACHE_TTL)
+    return _analytics_response(_summary_payload(days, bucket),
+                               'summary', days, bucket)
+
+
+@lru_cache(maxsize=32)
+def _trend_payload(days, bucket):
+    """Build the serialized trend data for one window."""
+    start_date = _window_start(days)
+
     with get_db_connection() as conn:
-        # Total views by page type
-        totals = conn.execute("""
-            SELECT page_type, COUNT(*) as count
-            FROM page_views
-            WHERE DATE(timestamp) >= ?
-            GROUP BY page_type
-            ORDER BY count DESC
-        """, (start_date,)).fetchall()
-        
-        # Views over time (daily)
-        daily = conn.execute("""
-            SELECT DATE(timestamp) as date, page_type, COUNT(*) as count
-            FROM page_views
-            WHERE DATE(timestamp) >= ?
-            GROUP BY DATE(timestamp), page_type
-            ORDER BY date
-        """, (start_date,)).fetchall()
-        
-        # Event page breakdown
-        events = conn.execute("""
-            SELECT page_detail, COUNT(*) as count
-            FROM page_views
-            WHERE page_type = 'event' AND DATE(timestamp) >= ?
-            GROUP BY page_detail
-            ORDER BY count DESC
-        """, (start_date,)).fetchall()
-        
-        # Team bests breakdown
-        team_bests_breakdown = conn.execute("""
-            SELECT page_detail, COUNT(*) as count
-            FROM page_views
-            WHERE page_type = 'team_bests' AND DATE(timestamp) >= ?
-            GROUP BY page_detail
-            ORDER BY count DESC
-        """, (start_date,)).fetchall()
-        
-        # Hourly distribution
-        hourly = conn.execute("""
-            SELECT CAST(strftime('%H', timestamp) AS INTEGER) as hour, COUNT(*) as count
-            FROM page_views
-            WHERE DATE(timestamp) >= ?
-            GROUP BY hour
-            ORDER BY hour
+        # Daily totals per page type, straight from the rollup the
+        # page-view writer maintains. Ordered by page type so each
+        # chart series arrives as one contiguous run
+        data = conn.execute("""
+            SELECT date, page_type, SUM(count) as count
+            FROM page_view_daily
+            WHERE date >= ?
+            GROUP BY page_type, date
+            ORDER BY page_type, date
         """, (start_date,)).fetchall()
-        
-        # Total views
-        total_views = conn.execute("""
-            SELECT COUNT(*) FROM page_views WHERE DATE(timestamp) >= ?
-        """, (start_date,)).fetchone()[0]
-    
-    return jsonify({
-        'period_days': days,
-        'start_date': start_date,
-        'total_views': total_views,
-        'by_page_type': [{'page_type': r['page_type'], 'count': r['count']} for r in totals],
-        'daily': [{'date': r['date'], 'page_type': r['page_type'], 'count': r['count']} for r in daily],
-        'events': [{'event': r['page_detail'], 'count': r['count']} for r in events],
-        'team_bests': [{'detail': r['page_detail'], 'count': r['count']} for r in team_bests_breakdown],
-        'hourly': [{'hour': r['hour'], 'count': r['count']} for r in hourly]
-    })
+
+    # One groupby pass with C-level zip instead of per-row dict probes
+    # and appends
+    result = {}
+    for page_type, series_rows in groupby(data, key=itemgetter(1)):
+        dates, _, counts = zip(*series_rows)
+        result[page_type] = {'dates': list(dates), 'counts': list(counts)}
+
+    return app.json.dumps(result)
 
 
 @app.route('/api/analytics/<secret>/trend')
@@ -885,30 +1480,11 @@ def analytics_trend(secret):
     """Get analytics trend data for charting."""
     if secret != ANALYTICS_SECRET:
         return jsonify({'error': 'Unauthorized'}), 403
-    
+
     days = request.args.get('days', 30, type=int)
-    start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-    
-    with get_db_connection() as conn:
-        # Get daily totals for each page type
-        data = conn.execute("""
-            SELECT DATE(timestamp) as date, page_type, COUNT(*) as count
-            FROM page_views
-            WHERE DATE(timestamp) >= ?
-            GROUP BY DATE(timestamp), page_type
-            ORDER BY date
-        """, (start_date,)).fetchall()
-    
-    # Organize by page type for charting
-    result = {}
-    for row in data:
-        page_type = row['page_type']
-        if page_type not in result:
-            result[page_type] = {'dates': [], 'counts': []}
-        result[page_type]['dates'].append(row['date'])
-        result[page_type]['counts'].append(row['count'])
-    
-    return jsonify(result)
+    bucket = int(time.time() // _ANALYTICS_CACHE_TTL)
+    return _analytics_response(_trend_payload(days, bucket),
+                               'trend', days, bucket)
 
 
 @app.errorhandler(404)
@@ -922,4 +1498,7 @@ def server_error(error):
 
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Local development entry point; production runs under gunicorn
+    # (docker/Dockerfile.webapp). Debug/reloader only when asked for
+    debug = os.environ.get('FLASK_DEBUG', '0') == '1'
+    app.run(debug=debug, host='0.0.0.0', port=5000)